@@ -1,67 +1,120 @@
-#!/usr/bin/env python3
-"""
-Build a JSON index of all .txt song files in the library.
-Run this after adding new songs to update the index.
-
-Usage:
-    python build_index.py
-"""
-
-import json
-import re
-from pathlib import Path
-
-
-def extract_metadata(content: str) -> dict:
-    """Extract title, artist, key from file content."""
-    metadata = {}
-
-    for line in content.split('\n')[:10]:
-        # ChordPro format: {title: ...}
-        match = re.match(r'\{(title|artist|key)\s*:\s*(.+?)\}', line, re.IGNORECASE)
-        if match:
-            metadata[match.group(1).lower()] = match.group(2).strip()
-
-    return metadata
-
-
-def build_index():
-    scripts_dir = Path(__file__).parent
-    library_dir = scripts_dir.parent / 'library'
-    songs = []
-
-    # Recursive glob for all .txt files
-    for txt_file in sorted(library_dir.glob('**/*.txt')):
-        # Skip trash, hidden directories, node_modules
-        if any(part.startswith('.') or part in ('node_modules', 'trash') for part in txt_file.parts):
-            continue
-
-        # Path relative to library dir
-        rel_path = str(txt_file.relative_to(library_dir))
-
-        try:
-            content = txt_file.read_text(encoding='utf-8')
-        except:
-            content = txt_file.read_text(encoding='latin-1')
-
-        metadata = extract_metadata(content)
-
-        songs.append({
-            'path': rel_path,
-            'title': metadata.get('title', txt_file.stem),
-            'artist': metadata.get('artist', ''),
-            'key': metadata.get('key', ''),
-        })
-
-    # Sort by title
-    songs.sort(key=lambda s: s['title'].lower())
-
-    # Write index
-    index_path = library_dir / 'index.json'
-    index_path.write_text(json.dumps(songs, indent=2), encoding='utf-8')
-
-    print(f"Indexed {len(songs)} songs -> {index_path}")
-
-
-if __name__ == '__main__':
-    build_index()
+#!/usr/bin/env python3
+"""
+Build a JSON index of all .txt song files in the library.
+Run this after adding new songs to update the index.
+
+Entries store each file's mtime and size; files that haven't changed since
+the previous index are reused without being read again.
+
+Usage:
+    python build_index.py [--compact]
+
+Options:
+    --compact  Write minified JSON (no indentation) for production
+"""
+
+import codecs
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+# ChordPro metadata directives: {title: ...}, {artist: ...}, {key: ...}
+META_RE = re.compile(r'\{(title|artist|key)\s*:\s*(.+?)\}', re.IGNORECASE)
+META_KEYS = ('title', 'artist', 'key')
+
+# Metadata lives in the first 10 lines; 4 KB covers that for any real chart
+HEAD_BYTES = 4096
+
+
+def _read_head(path: Path, nbytes: int = HEAD_BYTES) -> str:
+    """Read and decode the first nbytes of a file (UTF-8, falling back to latin-1)."""
+    with open(path, 'rb') as f:
+        data = f.read(nbytes)
+    try:
+        # Incremental decode tolerates a multi-byte character cut off at nbytes
+        return codecs.getincrementaldecoder('utf-8')().decode(data)
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def extract_metadata(content: str) -> dict:
+    """Extract title, artist, key from file content."""
+    metadata = {}
+
+    # splitlines() also handles CRLF/CR files, since content is decoded from raw bytes
+    for line in content.splitlines()[:10]:
+        match = META_RE.match(line)
+        if match:
+            metadata[match.group(1).lower()] = match.group(2).strip()
+            if len(metadata) == len(META_KEYS):
+                break
+
+    return metadata
+
+
+def load_cached_index(index_path: Path) -> dict:
+    """Load the previous index keyed by path (empty if missing or unreadable)."""
+    try:
+        entries = json.loads(index_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return {entry['path']: entry for entry in entries if 'path' in entry}
+
+
+def build_index(compact: bool = False):
+    scripts_dir = Path(__file__).parent
+    library_dir = scripts_dir.parent / 'library'
+    index_path = library_dir / 'index.json'
+    cached = load_cached_index(index_path)
+    songs = []
+    reused = 0
+
+    # Walk for all .txt files, pruning skipped directories before descending
+    for root, dirs, files in os.walk(library_dir):
+        # Skip trash, hidden directories, node_modules
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ('node_modules', 'trash')]
+
+        for name in files:
+            if not name.endswith('.txt') or name.startswith('.'):
+                continue
+            txt_file = Path(root) / name
+
+            # Path relative to library dir
+            rel_path = os.path.relpath(txt_file, library_dir)
+
+            # Reuse the previous entry if the file is unchanged
+            st = txt_file.stat()
+            entry = cached.get(rel_path)
+            if entry and entry.get('mtime') == st.st_mtime_ns and entry.get('size') == st.st_size:
+                songs.append(entry)
+                reused += 1
+                continue
+
+            metadata = extract_metadata(_read_head(txt_file))
+
+            songs.append({
+                'path': rel_path,
+                'title': metadata.get('title', txt_file.stem),
+                'artist': metadata.get('artist', ''),
+                'key': metadata.get('key', ''),
+                'mtime': st.st_mtime_ns,
+                'size': st.st_size,
+            })
+
+    # Sort by title (path breaks ties so output is stable)
+    songs.sort(key=lambda s: (s['title'].lower(), s['path']))
+
+    # Write index, streaming straight to the file
+    with index_path.open('w', encoding='utf-8') as f:
+        if compact:
+            json.dump(songs, f, separators=(',', ':'), ensure_ascii=False)
+        else:
+            json.dump(songs, f, indent=2, ensure_ascii=False)
+
+    print(f"Indexed {len(songs)} songs ({reused} unchanged) -> {index_path}")
+
+
+if __name__ == '__main__':
+    build_index(compact='--compact' in sys.argv[1:])
@@ -159,11 +159,14 @@ def convert_onsong_to_chordpro(content: str, filename: str = '') -> str:
 def convert_file(input_path: Path, output_path: Path) -> dict:
     """Convert a single file and return status."""
     try:
-        # Try UTF-8 first, fall back to latin-1
+        # Try UTF-8 first, fall back to latin-1 (decoding the same bytes, not re-reading)
+        data = input_path.read_bytes()
         try:
-            content = input_path.read_text(encoding='utf-8')
+            content = data.decode('utf-8')
         except UnicodeDecodeError:
-            content = input_path.read_text(encoding='latin-1')
+            content = data.decode('latin-1')
+        # Normalize newlines as read_text would
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
         converted = convert_onsong_to_chordpro(content, input_path.name)
 
@@ -6,19 +6,36 @@ Usage:
     python convert_pdf.py input.pdf [output.txt]
     python convert_pdf.py ./pdfs/ ./converted/  # batch mode
 
-Requires: pdfplumber>=0.10.0
+Options:
+    --page-delay SECONDS  Pause between pages to spread CPU load (default: 0).
+                          Pages and files are then converted one at a time.
+
+Requires: pymupdf>=1.24.3 (falls back to pdfplumber>=0.10.0 if unavailable)
 """
 
+import argparse
+import bisect
+import heapq
+import io
+import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
+from itertools import accumulate, groupby
+from operator import itemgetter
 from pathlib import Path
 
 try:
-    import pdfplumber
+    import pymupdf
 except ImportError:
-    print("Error: pdfplumber is required. Install with: pip install pdfplumber")
-    sys.exit(1)
+    pymupdf = None
+    try:
+        import pdfplumber
+    except ImportError:
+        print("Error: pymupdf is required. Install with: pip install pymupdf")
+        sys.exit(1)
 
 
 # Font-based classification thresholds
@@ -29,70 +46,220 @@ FONT_SECTION = ('Bold', 14.0, 16.0)     # Section names: Bold, ~14.8pt
 FONT_BADGE = ('Bold', 9.0, 11.0)        # Section badges: Bold, ~10.2pt
 FONT_DYNAMICS = ('Regular', 12.0, 13.0) # Dynamics: Regular, ~12.5pt
 
+# Chord modifiers (superscript text after a chord): sus, add, maj, min, dim, aug, m
+CHORD_MODIFIER_RE = re.compile(r'^(sus|add|maj|min|dim|aug|m)', re.IGNORECASE)
+
+# Metadata patterns (first page header)
+ARTIST_RE = re.compile(r'^(.+?)\s*Key:')
+KEY_RE = re.compile(r'Key:\s*([A-G][#b♯♭]?m?)')
+TEMPO_RE = re.compile(r'Tempo:\s*(\d+)')
+TIME_RE = re.compile(r'Time:\s*(\d+/\d+)')
+
+# Page header/footer words to skip: whole words, then substrings
+# (e.g. "MultiTracks.com")
+FOOTER_SKIP_WORDS = frozenset({'Page:', 'mtID:'})
+FOOTER_SKIP_SUBSTRINGS = ('MultiTracks', 'Writers:', 'Charts')
+
+# Section name cleanup
+TRAILING_RULE_RE = re.compile(r'[─━—–-]+$')
+SECTION_NUMBER_RE = re.compile(r'(\d+)\s*$')
+
+# Map common section name variations
+SECTION_NAME_MAP = {
+    'INTRO': 'Intro', 'VERSE': 'Verse', 'CHORUS': 'Chorus',
+    'PRE CHORUS': 'Pre Chorus', 'PRE-CHORUS': 'Pre Chorus',
+    'BRIDGE': 'Bridge', 'BREAKDOWN': 'Breakdown',
+    'INTERLUDE': 'Interlude', 'INSTRUMENTAL': 'Instrumental',
+    'VAMP': 'Vamp', 'TAG': 'Tag', 'REFRAIN': 'Refrain',
+    'ENDING': 'Ending', 'OUTRO': 'Outro', 'TURNAROUND': 'Turnaround',
+    'HALF-CHORUS': 'Half-Chorus'
+}
+
+
+# Word grouping tolerances (match pdfplumber's extract_words defaults used previously)
+WORD_X_TOLERANCE = 3
+LINE_Y_TOLERANCE = 3
+
+
+# Below this page count, pool startup costs more than parsing serially
+MIN_PAGES_FOR_POOL = 3
+
+
+def open_pdf(source):
+    """Open a PDF (path or raw bytes) with the available backend."""
+    if isinstance(source, bytes):
+        if pymupdf:
+            return pymupdf.open(stream=source, filetype='pdf')
+        return pdfplumber.open(io.BytesIO(source))
+    if pymupdf:
+        return pymupdf.open(source)
+    return pdfplumber.open(source)
+
+
+def get_pages(pdf):
+    """Return the list of pages for either backend."""
+    if pymupdf:
+        return list(pdf)
+    return pdf.pages
+
+
+def page_width(page):
+    return page.rect.width if pymupdf else page.width
+
+
+def extract_page_words(page):
+    """Extract words with font information as dicts with text, x0, top, bottom, fontname, size.
+
+    With PyMuPDF, characters are taken from the raw span data and joined into
+    words the same way pdfplumber does: split on whitespace, on a change of
+    font or size, or on a horizontal gap wider than WORD_X_TOLERANCE.
+    """
+    if not pymupdf:
+        return page.extract_words(x_tolerance=WORD_X_TOLERANCE, y_tolerance=LINE_Y_TOLERANCE,
+                                  extra_attrs=['fontname', 'size'])
+
+    words = []
+    flags = pymupdf.TEXT_PRESERVE_WHITESPACE | pymupdf.TEXT_INHIBIT_SPACES | pymupdf.TEXT_MEDIABOX_CLIP
+    for block in page.get_text('rawdict', flags=flags, sort=False)['blocks']:
+        for line in block.get('lines', []):
+            word = None
+            for span in line['spans']:
+                fontname = span['font']
+                size = span['size']
+                for char in span['chars']:
+                    c = char['c']
+                    x0, top, x1, bottom = char['bbox']
+                    if c.isspace():
+                        word = None
+                        continue
+                    if (word is None or word['fontname'] != fontname or word['size'] != size
+                            or x0 - word['x1'] > WORD_X_TOLERANCE):
+                        word = {'text': c, 'x0': x0, 'x1': x1, 'top': top, 'bottom': bottom,
+                                'fontname': fontname, 'size': size}
+                        words.append(word)
+                    else:
+                        word['text'] += c
+                        word['x1'] = max(word['x1'], x1)
+                        word['top'] = min(word['top'], top)
+                        word['bottom'] = max(word['bottom'], bottom)
+    return words
+
+
+def extract_page_curves(page):
+    """Extract curve objects (non-rectangle paths) as dicts with x0 and top."""
+    if not pymupdf:
+        return [{'x0': c.get('x0', c.get('x', 0)), 'top': c.get('top', c.get('y', 0))}
+                for c in page.objects.get('curve', [])]
+
+    # PyMuPDF merges a path's subpaths into one drawing, so each sharp glyph
+    # yields a single entry at its outer bounding box
+    curves = []
+    for path in page.get_drawings():
+        kinds = [item[0] for item in path['items']]
+        # Sharps are drawn as bezier curves or as multi-segment polygons
+        if 'c' in kinds or kinds.count('l') > 1:
+            curves.append({'x0': path['rect'].x0, 'top': path['rect'].y0})
+    return curves
+
+
+def words_to_text(words):
+    """Join extracted words into plain text, one line per visual text line."""
+    words = sorted(words, key=lambda w: (w['top'], w['x0']))
+    lines = []
+    current_line = []
+    current_top = None
+    for w in words:
+        if current_top is not None and w['top'] - current_top > LINE_Y_TOLERANCE:
+            lines.append(current_line)
+            current_line = []
+        if not current_line:
+            current_top = w['top']
+        current_line.append(w)
+    if current_line:
+        lines.append(current_line)
+    return '\n'.join(' '.join(w['text'] for w in sorted(line, key=lambda w: w['x0'])) for line in lines)
+
+
+# Unicode accidentals to ASCII, dropping spaces, in a single translate pass
+CHORD_TRANS = str.maketrans({'♯': '#', '♭': 'b', ' ': None})
+
 
 def normalize_chord(s):
-    return s.replace('♯', '#').replace('♭', 'b').replace(' ', '') if s else s
+    return s.translate(CHORD_TRANS) if s else s
 
 
-def classify_word(word):
-    """Classify word based on font name and size."""
-    fontname = word.get('fontname', '')
-    size = word.get('size', 0)
-    text = word.get('text', '')
+# A PDF uses only a handful of distinct (fontname, size) pairs, so the size
+# thresholds run once per pair
+@lru_cache(maxsize=64)
+def classify_font(fontname, size):
+    """Classify a (fontname, size) pair, ignoring the word's text.
 
+    Returns (label, is_bold); classify_word applies the text-dependent rules.
+    """
     is_bold = 'Bold' in fontname
     is_regular = 'Regular' in fontname or not is_bold
 
-    # Check for chord modifiers (superscript text that modifies a chord)
-    chord_modifier_patterns = ['sus', 'add', 'maj', 'min', 'dim', 'aug', 'm']
-    is_modifier = any(text.lower().startswith(mod) for mod in chord_modifier_patterns) or text.isdigit()
-
-    # Section badges: Bold, small (~10pt) - but not chord modifiers
+    # Section badges: Bold, small (~10pt)
     if is_bold and 9.0 <= size <= 11.0:
-        if is_modifier:
+        label = 'badge'
+    # Section names: Bold, medium-large (~14.8pt)
+    elif is_bold and 14.0 <= size <= 16.0:
+        label = 'section_name'
+    # Chords: Bold, medium (~13.6pt)
+    elif is_bold and 13.0 <= size <= 14.0:
+        label = 'chord'
+    # Dynamics: Regular, medium-small (~12.5pt)
+    elif is_regular and 12.0 <= size < 13.0:
+        label = 'dynamics'
+    # Lyrics: Regular, medium (~13.6pt)
+    elif is_regular and 13.0 <= size <= 14.0:
+        label = 'lyric'
+    # Title: Bold, large (>20pt)
+    elif is_bold and size > 20:
+        label = 'title'
+    # Artist/metadata: smaller text
+    elif size < 12:
+        label = 'meta'
+    else:
+        label = 'unknown'
+
+    return label, is_bold
+
+
+def classify_word(word):
+    """Classify word based on font name and size."""
+    text = word.get('text', '')
+    label, is_bold = classify_font(word.get('fontname', ''), word.get('size', 0))
+
+    # Section badges - but not chord modifiers (superscript text that modifies a chord)
+    if label == 'badge':
+        if CHORD_MODIFIER_RE.match(text) or text.isdigit():
             return 'chord_modifier'
         return 'badge'
 
-    # Section names: Bold, medium-large (~14.8pt)
-    if is_bold and 14.0 <= size <= 16.0:
-        return 'section_name'
+    if label == 'section_name':
+        return label
 
     # Bass notes (slash chords): Bold, starts with "/"
     if is_bold and text.startswith('/'):
         return 'bass_note'
 
     # Standalone minor "m" at chord size is a modifier, not a chord
-    if is_bold and 13.0 <= size <= 14.0 and text == 'm':
+    if label == 'chord' and text == 'm':
         return 'chord_modifier'
 
-    # Chords: Bold, medium (~13.6pt)
-    if is_bold and 13.0 <= size <= 14.0:
-        return 'chord'
+    return label
 
-    # Dynamics: Regular, medium-small (~12.5pt)
-    if is_regular and 12.0 <= size < 13.0:
-        return 'dynamics'
 
-    # Lyrics: Regular, medium (~13.6pt)
-    if is_regular and 13.0 <= size <= 14.0:
-        return 'lyric'
+def extract_metadata(words):
+    """Extract song metadata from the first page's words.
 
-    # Title: Bold, large (>20pt)
-    if is_bold and size > 20:
-        return 'title'
-
-    # Artist/metadata: smaller text
-    if size < 12:
-        return 'meta'
-
-    return 'unknown'
-
-
-def extract_metadata(pdf):
-    """Extract song metadata from first page."""
+    Takes the words parse_page also uses, so page 1 is only extracted once.
+    The text is rebuilt from word positions because PyMuPDF's get_text()
+    orders text by block, which puts the roadmap ahead of the title.
+    """
     metadata = {'title': '', 'artist': '', 'key': '', 'tempo': '', 'time': '4/4'}
-    page = pdf.pages[0]
-    text = page.extract_text() or ''
+    text = words_to_text(words)
     lines = text.split('\n')
 
     # Find title - may span multiple lines until we hit Page: or Key: line
@@ -103,7 +270,7 @@ def extract_metadata(pdf):
         if 'Page:' in line or 'Key:' in line:
             # This line has metadata, check if artist is before Key:
             if 'Key:' in line:
-                artist_match = re.match(r'^(.+?)\s*Key:', line)
+                artist_match = ARTIST_RE.match(line)
                 if artist_match:
                     artist_text = artist_match.group(1).strip()
                     # Skip if it looks like continuation of title
@@ -127,54 +294,46 @@ def extract_metadata(pdf):
     metadata['title'] = ' '.join(title_parts)
 
     # Extract key, tempo, time from text
-    m = re.search(r'Key:\s*([A-G][#b♯♭]?m?)', text)
-    if m: metadata['key'] = m.group(1).replace('♯', '#').replace('♭', 'b')
-    m = re.search(r'Tempo:\s*(\d+)', text)
+    m = KEY_RE.search(text)
+    if m: metadata['key'] = normalize_chord(m.group(1))
+    m = TEMPO_RE.search(text)
     if m: metadata['tempo'] = m.group(1)
-    m = re.search(r'Time:\s*(\d+/\d+)', text)
+    m = TIME_RE.search(text)
     if m: metadata['time'] = m.group(1)
 
     return metadata
 
 
-def detect_sharp_curves(page, chord_x, chord_y, modifier_x):
-    """Check if there's a sharp symbol (drawn as curves) between chord and modifier."""
-    curves = page.objects.get('curve', [])
-    # Look for curves between the chord letter and modifier
-    for curve in curves:
-        cx = curve.get('x0', curve.get('x', 0))
-        cy = curve.get('top', curve.get('y', 0))
-        # Sharp should be between chord and modifier horizontally, and at similar Y
-        if chord_x < cx < modifier_x and abs(cy - chord_y) < 10:
-            return True
-    return False
+def detect_sharp_curves(curves, curve_xs, chord_x, chord_y, modifier_x):
+    """Check if there's a sharp symbol (drawn as curves) between chord and modifier.
 
+    curves must be sorted by x0, with curve_xs holding their x0 values.
+    """
+    # Only look at curves strictly between the chord letter and modifier
+    lo = bisect.bisect_right(curve_xs, chord_x)
+    hi = bisect.bisect_left(curve_xs, modifier_x)
+    # Sharp should be at similar Y to the chord
+    return any(abs(curve['top'] - chord_y) < 10 for curve in curves[lo:hi])
 
-def parse_column(words, col_start_x, page=None):
-    """Parse a single column of words into sections using font-based classification."""
+
+def parse_column(words, col_start_x, curves=None, curve_xs=None):
+    """Parse a single column of words into sections using font-based classification.
+
+    curves (sorted by x0) and their curve_xs are fetched once per page by parse_page.
+    """
     if not words:
         return []
 
     sections = []
     current_section = None
 
-    # Group words into lines by y-position
+    # Group words into lines by y-position: a line is anchored at its first
+    # (topmost) word and takes every following word within 6pt of that anchor
     words = sorted(words, key=lambda w: (w['top'], w['x0']))
-    lines = []
-    current_line = []
-    current_y = None
-
-    for w in words:
-        if current_y is None or abs(w['top'] - current_y) <= 6:
-            current_line.append(w)
-            current_y = current_y or w['top']
-        else:
-            if current_line:
-                lines.append(sorted(current_line, key=lambda x: x['x0']))
-            current_line = [w]
-            current_y = w['top']
-    if current_line:
-        lines.append(sorted(current_line, key=lambda x: x['x0']))
+    anchors = accumulate((w['top'] for w in words),
+                         lambda anchor, top: anchor if top - anchor <= 6 else top)
+    lines = [sorted((w for _, w in group), key=lambda x: x['x0'])
+             for _, group in groupby(zip(anchors, words), key=itemgetter(0))]
 
     for line_words in lines:
         if not line_words:
@@ -217,53 +376,38 @@ def parse_column(words, col_start_x, page=None):
         # First, assign each modifier to its nearest preceding chord
         # Modifiers appear slightly to the right of their parent chord
         # Also detect sharp symbols (rendered as curves) between chord and modifier
+        # raw_chords is already in x order since line_words is sorted by x0
+        chord_xs = [chord_x for _, chord_x in raw_chords]
         chord_modifiers = {}  # chord_x -> list of modifier texts
         chord_has_sharp = {}  # chord_x -> True if sharp detected
         for mod_w, mod_x in modifiers:
             # Find the closest chord that is to the LEFT of this modifier
-            best_chord_x = None
-            best_chord_w = None
-            best_dist = 25  # Max distance (modifiers are close to their chord)
-            for chord_w, chord_x in raw_chords:
-                dist = mod_x - chord_x
-                if 0 < dist < best_dist:
-                    best_chord_x = chord_x
-                    best_chord_w = chord_w
-                    best_dist = dist
-            if best_chord_x is not None:
-                if best_chord_x not in chord_modifiers:
-                    chord_modifiers[best_chord_x] = []
+            i = bisect.bisect_left(chord_xs, mod_x) - 1
+            # Max distance 25 (modifiers are close to their chord)
+            if i >= 0 and mod_x - chord_xs[i] < 25:
+                chord_w, chord_x = raw_chords[i]
+                if chord_x not in chord_modifiers:
+                    chord_modifiers[chord_x] = []
                 # Check for sharp symbol (curve) between chord and modifier
-                if page and detect_sharp_curves(page, best_chord_x, best_chord_w['top'], mod_x):
-                    chord_has_sharp[best_chord_x] = True
-                chord_modifiers[best_chord_x].append(mod_w['text'])
+                if curves and detect_sharp_curves(curves, curve_xs, chord_x, chord_w['top'], mod_x):
+                    chord_has_sharp[chord_x] = True
+                chord_modifiers[chord_x].append(mod_w['text'])
 
         # Assign each bass note to its nearest preceding chord
         chord_bass = {}  # chord_x -> bass note text
         for bass_w, bass_x in bass_notes:
             # Find the closest chord that is to the LEFT of this bass note
-            best_chord_x = None
-            best_dist = 50  # Bass notes can be further from root
-            for chord_w, chord_x in raw_chords:
-                dist = bass_x - chord_x
-                if 0 < dist < best_dist:
-                    best_chord_x = chord_x
-                    best_dist = dist
-            if best_chord_x is not None:
-                chord_bass[best_chord_x] = bass_w['text']
+            i = bisect.bisect_left(chord_xs, bass_x) - 1
+            # Max distance 50 (bass notes can be further from root)
+            if i >= 0 and bass_x - chord_xs[i] < 50:
+                chord_bass[chord_xs[i]] = bass_w['text']
 
         # Also detect sharps on standalone chords (no modifier) by looking for curves after chord
         for chord_w, chord_x in raw_chords:
             if chord_x not in chord_modifiers and chord_x not in chord_has_sharp:
                 # Look for sharp curve right after this chord (within 15px)
-                if page:
-                    curves = page.objects.get('curve', [])
-                    for curve in curves:
-                        cx = curve.get('x0', curve.get('x', 0))
-                        cy = curve.get('top', curve.get('y', 0))
-                        if chord_x < cx < chord_x + 15 and abs(cy - chord_w['top']) < 10:
-                            chord_has_sharp[chord_x] = True
-                            break
+                if curves and detect_sharp_curves(curves, curve_xs, chord_x, chord_w['top'], chord_x + 15):
+                    chord_has_sharp[chord_x] = True
 
         # Build chord list with sharps, modifiers, and bass notes attached
         chords = []
@@ -325,8 +469,9 @@ def parse_column(words, col_start_x, page=None):
                     next_lyrics = next_line.get('lyrics', [])
                     # Merge if next line has lyrics (with or without chords)
                     if next_lyrics:
+                        # Keep chords in x order (build_line relies on it)
                         merged_lines.append({
-                            'chords': chords + next_chords,
+                            'chords': list(heapq.merge(chords, next_chords, key=lambda c: c['x'])),
                             'lyrics': next_lyrics
                         })
                         i += 2
@@ -339,15 +484,18 @@ def parse_column(words, col_start_x, page=None):
     return sections
 
 
-def parse_page(page, page_num, title=''):
-    """Parse page by processing left and right columns separately."""
+def parse_page(page, page_num, title='', words=None):
+    """Parse page by processing left and right columns separately.
+
+    Pass words if they were already extracted from this page.
+    """
     # Get words with font information
-    words = page.extract_words(x_tolerance=3, y_tolerance=3, extra_attrs=['fontname', 'size'])
+    if words is None:
+        words = extract_page_words(page)
     if not words:
         return []
 
-    page_width = page.width
-    mid_x = page_width / 2
+    mid_x = page_width(page) / 2
 
     # For page 1, dynamically detect roadmap area
     if page_num == 0:
@@ -366,8 +514,10 @@ def parse_page(page, page_num, title=''):
     else:
         min_y = 45
 
-    # Filter words
-    filtered = []
+    # Filter words and split into columns in a single pass
+    col_split_x = mid_x - 30
+    left_words = []
+    right_words = []
     for w in words:
         if w['top'] < min_y:
             continue
@@ -375,155 +525,187 @@ def parse_page(page, page_num, title=''):
         if not text:
             continue
         # Skip page/footer elements
-        if any(skip in text for skip in ['Page:', 'MultiTracks', 'mtID', 'Writers:', 'Charts']):
+        if text in FOOTER_SKIP_WORDS or any(skip in text for skip in FOOTER_SKIP_SUBSTRINGS):
             continue
-        if text.startswith('©') or text.startswith('℗'):
+        if text.startswith(('©', '℗')):
             continue
         if 'a product of' in text.lower():
             continue
         # Skip title appearing again in header
         if text == title and w['top'] < 60:
             continue
-        filtered.append(w)
+        (left_words if w['x0'] < col_split_x else right_words).append(w)
 
-    if not filtered:
+    # Skip pages with no section headers or chords (cover/info pages):
+    # parse_column only emits lines inside a section, so they'd yield nothing
+    if not any(classify_font(w.get('fontname', ''), w.get('size', 0))[0] in ('section_name', 'chord')
+               for w in left_words + right_words):
         return []
 
-    # Split into columns
-    left_words = [w for w in filtered if w['x0'] < mid_x - 30]
-    right_words = [w for w in filtered if w['x0'] >= mid_x - 30]
-
     # Find column start positions
     left_start_x = min((w['x0'] for w in left_words), default=40)
     right_start_x = min((w['x0'] for w in right_words), default=mid_x)
 
-    # Parse each column (pass page for sharp detection)
-    left_sections = parse_column(left_words, left_start_x, page)
-    right_sections = parse_column(right_words, right_start_x, page)
+    # Fetch curves once per page for sharp detection, sorted by x for range lookups
+    curves = sorted(extract_page_curves(page), key=lambda c: c['x0'])
+    curve_xs = [c['x0'] for c in curves]
+
+    # Parse each column
+    left_sections = parse_column(left_words, left_start_x, curves, curve_xs)
+    right_sections = parse_column(right_words, right_start_x, curves, curve_xs)
 
     return left_sections + right_sections
 
 
 def build_line(line_data):
-    """Build ChordPro line from chord/lyric data."""
+    """Build ChordPro line from chord/lyric data.
+
+    Chords and lyrics must already be sorted by x, as parse_column produces them.
+    """
     chords = line_data.get('chords', [])
     lyrics = line_data.get('lyrics', [])
 
     if not chords and not lyrics:
         return ''
     if not chords:
-        return ' '.join(l['text'] for l in sorted(lyrics, key=lambda x: x['x']))
+        return ' '.join(l['text'] for l in lyrics)
     if not lyrics:
-        return ' '.join(f"[{c['text']}]" for c in sorted(chords, key=lambda x: x['x']))
-
-    # Merge by x position
-    chords = sorted(chords, key=lambda c: c['x'])
-    lyrics = sorted(lyrics, key=lambda l: l['x'])
+        return ' '.join(f"[{c['text']}]" for c in chords)
 
+    # Merge by x position: chords up to 15pt past a lyric's start go before it
+    chord_xs = [c['x'] for c in chords]
     result = []
+    out = result.append
     ci = 0
     for lyric in lyrics:
-        while ci < len(chords) and chords[ci]['x'] <= lyric['x'] + 15:
-            result.append(f"[{chords[ci]['text']}]")
-            ci += 1
-        result.append(lyric['text'])
-    while ci < len(chords):
-        result.append(f"[{chords[ci]['text']}]")
-        ci += 1
+        cj = bisect.bisect_right(chord_xs, lyric['x'] + 15, ci)
+        for chord in chords[ci:cj]:
+            out(f"[{chord['text']}]")
+        ci = cj
+        out(lyric['text'])
+    for chord in chords[ci:]:
+        out(f"[{chord['text']}]")
 
     return ' '.join(result)
 
 
+# Section names repeat throughout a chart (INTRO, VERSE 1, CHORUS, ...)
+@lru_cache(maxsize=256)
 def format_section_name(name):
     """Format section name properly."""
     name = name.strip()
 
     # Remove horizontal line characters
-    name = re.sub(r'[─━—–-]+$', '', name).strip()
-
-    # Map common variations
-    name_map = {
-        'INTRO': 'Intro', 'VERSE': 'Verse', 'CHORUS': 'Chorus',
-        'PRE CHORUS': 'Pre Chorus', 'PRE-CHORUS': 'Pre Chorus',
-        'BRIDGE': 'Bridge', 'BREAKDOWN': 'Breakdown',
-        'INTERLUDE': 'Interlude', 'INSTRUMENTAL': 'Instrumental',
-        'VAMP': 'Vamp', 'TAG': 'Tag', 'REFRAIN': 'Refrain',
-        'ENDING': 'Ending', 'OUTRO': 'Outro', 'TURNAROUND': 'Turnaround',
-        'HALF-CHORUS': 'Half-Chorus'
-    }
+    name = TRAILING_RULE_RE.sub('', name).strip()
 
     # Extract number suffix if present
-    num_match = re.search(r'(\d+)\s*$', name)
+    num_match = SECTION_NUMBER_RE.search(name)
     number = ' ' + num_match.group(1) if num_match else ''
     if num_match:
         name = name[:num_match.start()].strip()
 
     # Convert to title case
     upper_name = name.upper()
-    formatted = name_map.get(upper_name, name.title())
+    formatted = SECTION_NAME_MAP.get(upper_name, name.title())
 
     return formatted + number
 
 
-def convert_pdf(pdf_path):
-    """Convert a PDF file to ChordPro format."""
-    with pdfplumber.open(pdf_path) as pdf:
-        metadata = extract_metadata(pdf)
-        title = metadata.get('title', '')
-
-        all_sections = []
-        for page_num, page in enumerate(pdf.pages):
-            # Rate limiting: small delay between pages to spread CPU load
-            if page_num > 0:
-                time.sleep(0.1)
-            all_sections.extend(parse_page(page, page_num, title))
-
-    # Build output
-    lines = [f"{{title: {metadata.get('title', 'Untitled')}}}"]
+def emit_chordpro(metadata, sections):
+    """Yield ChordPro output lines for the song metadata and parsed sections."""
+    yield f"{{title: {metadata.get('title', 'Untitled')}}}"
     if metadata.get('artist'):
-        lines.append(f"{{artist: {metadata['artist']}}}")
+        yield f"{{artist: {metadata['artist']}}}"
     if metadata.get('key'):
-        lines.append(f"{{key: {metadata['key']}}}")
+        yield f"{{key: {metadata['key']}}}"
     if metadata.get('tempo'):
-        lines.append(f"{{tempo: {metadata['tempo']}}}")
+        yield f"{{tempo: {metadata['tempo']}}}"
     if metadata.get('time'):
-        lines.append(f"{{time: {metadata['time']}}}")
-    lines.append('')
+        yield f"{{time: {metadata['time']}}}"
+    yield ''
 
-    for section in all_sections:
-        lines.append(f"{{section: {section['name']}}}")
+    for section in sections:
+        yield f"{{section: {section['name']}}}"
         if section.get('dynamics'):
-            lines.append(f"{{dynamics: {section['dynamics']}}}")
+            yield f"{{dynamics: {section['dynamics']}}}"
         for line_data in section.get('lines', []):
             if line_data.get('type') == 'dynamics':
-                lines.append(f"{{dynamics: {line_data['text']}}}")
+                yield f"{{dynamics: {line_data['text']}}}"
             else:
                 out = build_line(line_data)
                 if out:
-                    lines.append(out)
-        lines.append('')
+                    yield out
+        yield ''
+
+
+def _parse_one_page(pdf_bytes, page_num, title):
+    """Parse a single page in a worker process.
+
+    Page objects can't be pickled, so each worker reopens the PDF from bytes.
+    """
+    with open_pdf(pdf_bytes) as pdf:
+        return page_num, parse_page(get_pages(pdf)[page_num], page_num, title)
 
-    return '\n'.join(lines)
+
+def convert_pdf(pdf_path, parallel_pages=True, page_delay=0):
+    """Convert a PDF file to ChordPro format.
+
+    Set parallel_pages=False when already running inside a worker process.
+    A non-zero page_delay parses pages serially, sleeping between them.
+    """
+    pdf_bytes = Path(pdf_path).read_bytes()
+    with open_pdf(pdf_bytes) as pdf:
+        pages = get_pages(pdf)
+
+        # Page 1 words give the metadata (title is needed to parse every page)
+        # and are then parsed here directly
+        first_words = extract_page_words(pages[0])
+        metadata = extract_metadata(first_words)
+        title = metadata.get('title', '')
+        all_sections = parse_page(pages[0], 0, title, first_words)
+
+        if page_delay or not parallel_pages or len(pages) < MIN_PAGES_FOR_POOL:
+            for page_num in range(1, len(pages)):
+                if page_delay:
+                    time.sleep(page_delay)
+                all_sections.extend(parse_page(pages[page_num], page_num, title))
+        else:
+            # Parse remaining pages in parallel, then reassemble in page order
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pages) - 1)) as executor:
+                futures = [executor.submit(_parse_one_page, pdf_bytes, page_num, title)
+                           for page_num in range(1, len(pages))]
+                results = [future.result() for future in as_completed(futures)]
+            for _, sections in sorted(results, key=lambda r: r[0]):
+                all_sections.extend(sections)
+
+    return '\n'.join(emit_chordpro(metadata, all_sections))
 
 
 def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='PDF file, or directory of PDFs for batch mode')
+    parser.add_argument('output', nargs='?', help='output .txt file, or output directory for batch mode')
+    parser.add_argument('--page-delay', type=float, default=0, metavar='SECONDS',
+                        help='pause between pages (default: 0)')
+    args = parser.parse_args()
 
-    input_path = Path(sys.argv[1])
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    input_path = Path(args.input)
+    output_path = args.output
 
     if input_path.is_dir():
         output_dir = Path(output_path) if output_path else input_path / 'converted'
         output_dir.mkdir(parents=True, exist_ok=True)
-        for pdf in input_path.glob('*.pdf'):
-            result = convert_pdf(pdf)
-            if result:
-                (output_dir / (pdf.stem + '.txt')).write_text(result, encoding='utf-8')
-                print(f"Converted: {pdf.name}", file=sys.stderr)
+        pdfs = list(input_path.glob('*.pdf'))
+        # Convert files in parallel (pages serially within each worker);
+        # results are written here in the parent process
+        convert = partial(convert_pdf, parallel_pages=False, page_delay=args.page_delay)
+        with ProcessPoolExecutor(max_workers=1 if args.page_delay else None) as executor:
+            for pdf, result in zip(pdfs, executor.map(convert, pdfs)):
+                if result:
+                    (output_dir / (pdf.stem + '.txt')).write_text(result, encoding='utf-8')
+                    print(f"Converted: {pdf.name}", file=sys.stderr)
     else:
-        result = convert_pdf(input_path)
+        result = convert_pdf(input_path, page_delay=args.page_delay)
         if result:
             if output_path:
                 Path(output_path).write_text(result, encoding='utf-8')
@@ -237,11 +237,14 @@ def process_directory(input_dir: Path, output_dir: Path):
 
     for input_path in sorted(txt_files):
         try:
-            # Try UTF-8 first, fall back to latin-1
+            # Try UTF-8 first, fall back to latin-1 (decoding the same bytes, not re-reading)
+            data = input_path.read_bytes()
             try:
-                content = input_path.read_text(encoding='utf-8')
+                content = data.decode('utf-8')
             except UnicodeDecodeError:
-                content = input_path.read_text(encoding='latin-1')
+                content = data.decode('latin-1')
+            # Normalize newlines as read_text would
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
 
             converted, key, ok = convert_file(content, input_path.name)
 